@@ -1,9 +1,16 @@
 #!/usr/bin/env python3
 import argparse
-import csv
+import ctypes
+import errno
+import operator
+import os
 import socket
+import struct
+import sys
+import threading
 import time
-from dataclasses import dataclass
+from collections import deque
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import List, Optional, Tuple
 
@@ -14,44 +21,108 @@ ESP32_IP = "192.168.1.60"
 ESP32_PORT = 5005
 
 SEND_HZ = 20.0
+CSV_FLUSH_S = 1.0  # max CSV data held in the write buffer (lost on a hard kill)
+CLOCK_ANCHOR_S = 60.0  # how often CSV ts_unix re-syncs to time.time()
+SESSION_REFRESH_TICKS = 60  # re-read per-session values every ~3 s at SEND_HZ
 LOG_PATH = f"iracing_telemetry_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
 
-
-def ir_get(ir, key, default=0.0):
+# UDP payload (15 values) — MUST match ESP32 parse order:
+# seq,rpm,gear,thr,brk,session_remain_s,fuel_l,incidents,speed_kmh,lap,pos,class_pos,lap_cur,lap_last,lap_best
+# Formatted with bytes %-interpolation so no str is built and encoded per tick.
+# Everything after seq is formatted separately so it can be reused while the
+# values don't change (menus, paused replays); only seq is re-rendered then.
+PAYLOAD_SEQ_FMT = b"%d"
+PAYLOAD_TAIL_FMT = (
+    b",%.1f,%d,"
+    b"%.3f,%.3f,%.2f,"
+    b"%.3f,%d,"
+    b"%.2f,"
+    b"%d,%d,%d,"
+    b"%.3f,%.3f,%.3f"
+)
+
+# CSV columns. Every field is numeric, so rows are formatted straight to bytes
+# (no quoting needed; %r gives the same text as str() for ints/floats); lines
+# end in "\r\n" like csv.writer's default dialect.
+CSV_COLUMNS = (
+    "ts_unix", "seq",
+    "rpm", "gear", "throttle", "brake", "steer_norm",
+    "session_remain_s",
+    "fuel_l", "fuel_pct", "speed_kmh",
+    "incidents",
+    "lap", "pos", "class_pos",
+    "lap_cur", "lap_last", "lap_best",
+    "is_replay",
+)
+CSV_HEADER = ",".join(CSV_COLUMNS).encode("ascii") + b"\r\n"
+CSV_ROW_FMT = b",".join([b"%r"] * len(CSV_COLUMNS)) + b"\r\n"
+
+
+# What an SDK read can raise: a torn-down/half-initialized SDK or a short
+# shared-memory read. Shared by ir_get() and ir_get_tick().
+_SDK_READ_ERRORS = (KeyError, AttributeError, TypeError, struct.error)
+
+
+def ir_get(get, key, default=0.0):
+    """
+    `get` is the SDK's bound `ir.__getitem__`, cached once by run().
+    pyirsdk returns None for unknown vars; only a torn-down/half-initialized
+    SDK (or a short shared-memory read) actually raises.
+    """
     try:
-        return ir[key]
-    except Exception:
+        v = get(key)
+    except _SDK_READ_ERRORS:
         return default
+    return default if v is None else v
 
 
-def ir_get_idx(ir, key, idx, default=0.0):
-    """Safely read an indexed (CarIdx...) array value."""
+# Per-tick SDK variables, fetched together by ir_get_tick() (order matters)
+TICK_VARS = (
+    "IsReplayPlaying", "SessionUniqueID",
+    "RPM", "Gear", "Throttle", "Brake",
+    "SteeringWheelAngle",
+    "FuelLevel", "FuelLevelPct", "Speed",
+    "Lap", "PlayerCarPosition", "PlayerCarClassPosition",
+    "LapCurrentLapTime", "LapLastLapTime", "LapBestLapTime",
+)
+_fetch_tick_vars = operator.itemgetter(*TICK_VARS)
+
+
+def ir_get_tick(ir) -> tuple:
+    """
+    Read all TICK_VARS with one C-level itemgetter call on the SDK.
+    Missing vars come back as None; if the SDK read fails, all are None.
+    """
     try:
-        arr = ir[key]
-        if isinstance(arr, (list, tuple)) and 0 <= idx < len(arr):
-            return arr[idx]
-        return default
-    except Exception:
-        return default
+        return _fetch_tick_vars(ir)
+    except _SDK_READ_ERRORS:
+        return (None,) * len(TICK_VARS)
+
+
+def ir_get_idx(get, key, idx, default=0.0):
+    """Safely read an indexed (CarIdx...) array value."""
+    arr = ir_get(get, key, None)
+    if isinstance(arr, (list, tuple)) and 0 <= idx < len(arr):
+        return arr[idx]
+    return default
 
 
 def norm_pct(x):
     """FuelLevelPct is usually 0..1. Handle 0..100 just in case."""
     try:
         x = float(x)
-    except Exception:
+    except (TypeError, ValueError):
         return 0.0
-    if x > 1.5:
-        x = x / 100.0
-    return max(0.0, min(1.0, x))
+    return max(0.0, min(1.0, x / 100.0 if x > 1.5 else x))
 
 
-def get_session_time_remain(ir) -> float:
+def get_session_time_remain(get, total: float) -> float:
     """
-    Prefer SessionTimeRemain. If missing/0, try SessionTimeTotal - SessionTime.
+    Prefer SessionTimeRemain. If missing/0, try SessionTimeTotal - SessionTime
+    (`total` is SessionTimeTotal, cached per session by run()).
     Returns seconds (>= 0).
     """
-    remain = ir_get(ir, "SessionTimeRemain", None)
+    remain = ir_get(get, "SessionTimeRemain", None)
     try:
         if remain is not None:
             remain = float(remain)
@@ -60,20 +131,19 @@ def get_session_time_remain(ir) -> float:
     except Exception:
         pass
 
-    total = float(ir_get(ir, "SessionTimeTotal", 0.0))
-    cur = float(ir_get(ir, "SessionTime", 0.0))
+    cur = float(ir_get(get, "SessionTime", 0.0))
     if total > 0.0 and cur >= 0.0:
         return max(0.0, total - cur)
 
     return 0.0
 
 
-def get_incidents(ir) -> int:
+def get_incidents(get) -> int:
     """
     Try common iRacing variables for incident points.
     """
     for key in ("PlayerCarMyIncidentCount", "PlayerCarTeamIncidentCount", "PlayerCarIncidentCount"):
-        val = ir_get(ir, key, None)
+        val = ir_get(get, key, None)
         if val is None:
             continue
         try:
@@ -83,25 +153,316 @@ def get_incidents(ir) -> int:
     return 0
 
 
+def open_udp_socket() -> socket.socket:
+    """
+    UDP socket for telemetry: larger send buffer so a briefly busy network
+    stack doesn't drop/block sends, and low-delay TOS / high priority marking.
+    Options the OS doesn't support are skipped.
+    """
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    opts = [
+        (socket.SOL_SOCKET, socket.SO_SNDBUF, 256 * 1024),
+        (socket.IPPROTO_IP, getattr(socket, "IP_TOS", None), 0x10),    # IPTOS_LOWDELAY
+        (socket.SOL_SOCKET, getattr(socket, "SO_PRIORITY", None), 6),  # Linux only
+    ]
+    for level, opt, value in opts:
+        if opt is None:
+            continue
+        try:
+            sock.setsockopt(level, opt, value)
+        except OSError:
+            pass
+    return sock
+
+
 @dataclass
 class Dest:
     host: str
     port: int
     resolved_ip: Optional[str] = None
     last_resolve: float = 0.0
+    sock: Optional[socket.socket] = field(default=None, init=False, repr=False, compare=False)
+    connected_ip: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False, compare=False)
+    _resolving: bool = field(default=False, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Literal IPv4 (the usual ESP32 setup): no DNS lookups at all
+        try:
+            self.resolved_ip = socket.inet_ntoa(socket.inet_aton(self.host))
+            self.last_resolve = float("inf")
+        except OSError:
+            pass
 
     def resolve(self, interval_s: float = 5.0) -> Optional[Tuple[str, int]]:
-        now = time.time()
-        if self.resolved_ip is None or (now - self.last_resolve) > interval_s:
-            try:
-                self.resolved_ip = socket.gethostbyname(self.host)
-                self.last_resolve = now
-            except Exception:
-                self.resolved_ip = None
-                self.last_resolve = now
-        if self.resolved_ip is None:
+        """
+        Return the cached (ip, port). Hostnames are re-resolved every interval_s
+        on a background thread so a slow DNS lookup never blocks the send loop.
+        """
+        now = time.monotonic()
+        if (now - self.last_resolve) > interval_s:
+            with self._lock:
+                if not self._resolving:
+                    self._resolving = True
+                    self.last_resolve = now
+                    threading.Thread(target=self._resolve_bg, daemon=True).start()
+        ip = self.resolved_ip
+        if ip is None:
+            return None
+        return (ip, self.port)
+
+    def _resolve_bg(self) -> None:
+        try:
+            ip = socket.gethostbyname(self.host)
+        except Exception:
+            ip = None
+        with self._lock:
+            # Keep the last good IP through a transient DNS/mDNS failure
+            if ip is not None:
+                self.resolved_ip = ip
+            self._resolving = False
+
+    def send(self, payload: bytes) -> bool:
+        """
+        Send via a UDP socket connect()ed to this destination, so the hot path
+        is a plain send() without per-call address parsing. Reconnects when
+        resolve() reports a new IP.
+        Returns False if the packet wasn't sent (unresolved host or OSError).
+        """
+        resolved = self.resolve(interval_s=5.0)
+        if resolved is None:
+            return False
+        if self.sock is None:
+            self.sock = open_udp_socket()
+        try:
+            if self.connected_ip != resolved[0]:
+                self.connected_ip = None
+                self.sock.connect(resolved)
+                self.connected_ip = resolved[0]
+            self.sock.send(payload)
+        except OSError:
+            # Fire-and-forget: connect() can fail (EACCES for broadcast,
+            # ENETUNREACH with Wi-Fi down) and connected UDP sockets surface
+            # ICMP errors (e.g. ESP32 offline). An unset connected_ip means
+            # the next tick retries the connect.
+            return False
+        return True
+
+    def close(self) -> None:
+        if self.sock is not None:
+            self.sock.close()
+            self.sock = None
+            self.connected_ip = None
+
+
+class _IOVec(ctypes.Structure):
+    _fields_ = [("iov_base", ctypes.c_void_p), ("iov_len", ctypes.c_size_t)]
+
+
+class _SockAddrIn(ctypes.Structure):
+    _fields_ = [
+        ("sin_family", ctypes.c_ushort),
+        ("sin_port", ctypes.c_uint16),   # network byte order
+        ("sin_addr", ctypes.c_uint32),   # network byte order
+        ("sin_zero", ctypes.c_char * 8),
+    ]
+
+
+class _MsgHdr(ctypes.Structure):
+    _fields_ = [
+        ("msg_name", ctypes.c_void_p),
+        ("msg_namelen", ctypes.c_uint32),
+        ("msg_iov", ctypes.POINTER(_IOVec)),
+        ("msg_iovlen", ctypes.c_size_t),
+        ("msg_control", ctypes.c_void_p),
+        ("msg_controllen", ctypes.c_size_t),
+        ("msg_flags", ctypes.c_int),
+    ]
+
+
+class _MMsgHdr(ctypes.Structure):
+    _fields_ = [("msg_hdr", _MsgHdr), ("msg_len", ctypes.c_uint)]
+
+
+def _load_sendmmsg():
+    """Return libc's sendmmsg(2), or None when not on Linux / not available."""
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        fn = ctypes.CDLL("libc.so.6", use_errno=True).sendmmsg
+    except (OSError, AttributeError):
+        return None
+    fn.argtypes = [ctypes.c_int, ctypes.POINTER(_MMsgHdr), ctypes.c_uint, ctypes.c_int]
+    fn.restype = ctypes.c_int
+    return fn
+
+
+class MultiSender:
+    """
+    Send the same payload to several destinations with one sendmmsg(2) call
+    per tick instead of one syscall per destination (Linux only; build it via
+    create(), which returns None where sendmmsg isn't available).
+    send() returns the number of destinations the packet didn't reach, or
+    None if the kernel turns out not to support sendmmsg (ENOSYS) so the
+    caller can fall back to Dest.send().
+    """
+
+    @classmethod
+    def create(cls, dests: List[Dest]) -> Optional["MultiSender"]:
+        if len(dests) < 2:
+            return None
+        sendmmsg = _load_sendmmsg()
+        if sendmmsg is None:
+            return None
+        return cls(dests, sendmmsg)
+
+    def __init__(self, dests: List[Dest], sendmmsg):
+        self.dests = dests
+        self._sendmmsg = sendmmsg
+        self._sock = open_udp_socket()
+        n = len(dests)
+        self._iov = _IOVec()
+        self._addrs = (_SockAddrIn * n)()
+        self._ips: List[Optional[str]] = [None] * n
+        self._msgs = (_MMsgHdr * n)()
+        for m in self._msgs:
+            m.msg_hdr.msg_namelen = ctypes.sizeof(_SockAddrIn)
+            m.msg_hdr.msg_iov = ctypes.pointer(self._iov)
+            m.msg_hdr.msg_iovlen = 1
+
+    def send(self, payload: bytes) -> Optional[int]:
+        if self._sendmmsg is None:
             return None
-        return (self.resolved_ip, self.port)
+
+        # Fill one mmsghdr per currently-resolved destination
+        n = 0
+        for i, d in enumerate(self.dests):
+            resolved = d.resolve(interval_s=5.0)
+            if resolved is None:
+                continue
+            addr = self._addrs[i]
+            if self._ips[i] != resolved[0]:
+                addr.sin_family = socket.AF_INET
+                addr.sin_port = socket.htons(resolved[1])
+                addr.sin_addr = int.from_bytes(socket.inet_aton(resolved[0]), sys.byteorder)
+                self._ips[i] = resolved[0]
+            self._msgs[n].msg_hdr.msg_name = ctypes.addressof(addr)
+            n += 1
+        failed = len(self.dests) - n  # unresolved
+        if n == 0:
+            return failed
+
+        buf = ctypes.c_char_p(payload)  # points at the bytes object, no copy
+        self._iov.iov_base = ctypes.cast(buf, ctypes.c_void_p)
+        self._iov.iov_len = len(payload)
+
+        fd = self._sock.fileno()
+        sent = 0
+        while sent < n:
+            ret = self._sendmmsg(fd, ctypes.byref(self._msgs[sent]), n - sent, 0)
+            if ret < 0:
+                if ctypes.get_errno() == errno.ENOSYS:
+                    self._sendmmsg = None
+                    return None
+                failed += 1
+                ret = 1  # skip the destination that failed, keep sending the rest
+            sent += ret
+        return failed
+
+    def close(self) -> None:
+        self._sock.close()
+
+
+class SendWorker:
+    """
+    Background thread for the I/O half of each tick: UDP sends and CSV rows.
+    The SDK loop hands off (payload, row) with put() and moves on. Packets go
+    through a single slot where the newest replaces any unsent one, so a
+    stalled network never back-pressures the SDK reads and the ESP32 never
+    gets a burst of stale packets after a stall; CSV rows get their own unbounded queue and
+    are never dropped.
+    Packets that didn't reach a destination are counted per destination
+    (send_errors, shown as tx_err in the status line); any other failure
+    (e.g. the CSV disk is full) stops the worker and the next put() raises.
+    """
+
+    def __init__(self, dests: List[Dest], multi: Optional[MultiSender], f=None):
+        self.dests = dests
+        self.multi = multi
+        self.f = f
+        self._packets = deque(maxlen=1)
+        self._rows = deque()
+        self._stopping = False
+        self._cond = threading.Condition()
+        self.send_errors = 0
+        self.error: Optional[BaseException] = None
+        self._thread = threading.Thread(target=self._run, name="udp-send", daemon=True)
+        self._thread.start()
+
+    def put(self, payload: bytes, row: Optional[tuple]) -> None:
+        if not self._thread.is_alive():
+            raise RuntimeError("send worker stopped") from self.error
+        with self._cond:
+            self._packets.append(payload)
+            if row is not None:
+                self._rows.append(row)
+            self._cond.notify()
+
+    def stop(self, timeout: float = 2.0) -> bool:
+        """
+        Send/write everything already queued, then end the thread.
+        Returns False if it is still busy after `timeout`; the caller must not
+        close the sockets/file out from under it in that case.
+        """
+        with self._cond:
+            self._stopping = True
+            self._cond.notify()
+        self._thread.join(timeout)
+        return not self._thread.is_alive()
+
+    def _run(self) -> None:
+        try:
+            self._loop()
+        except BaseException as e:
+            self.error = e
+            raise
+
+    def _loop(self) -> None:
+        last_flush = time.monotonic()
+        unflushed = False
+        while True:
+            with self._cond:
+                # Timed wait so buffered rows still get flushed while the main
+                # loop is idle (e.g. waiting for the SDK)
+                if not self._packets and not self._rows and not self._stopping:
+                    self._cond.wait(CSV_FLUSH_S)
+                if self._stopping and not self._packets and not self._rows:
+                    break  # stopping and fully drained
+                payload = self._packets.popleft() if self._packets else None
+                rows, self._rows = self._rows, deque()
+
+            # Send to all destinations (ESP32, Pi, etc.)
+            if payload is not None:
+                try:
+                    failed = None if self.multi is None else self.multi.send(payload)
+                    if failed is None:
+                        failed = sum(not d.send(payload) for d in self.dests)
+                    self.send_errors += failed
+                except OSError:
+                    # e.g. the socket itself couldn't be created
+                    self.send_errors += len(self.dests)
+
+            # Optional CSV logging: rows collect in the file's 64 KiB write
+            # buffer, flushed to the OS about once per CSV_FLUSH_S
+            if self.f is not None:
+                for row in rows:
+                    self.f.write(CSV_ROW_FMT % row)
+                    unflushed = True
+                now = time.monotonic()
+                if unflushed and now - last_flush >= CSV_FLUSH_S:
+                    self.f.flush()
+                    last_flush = now
+                    unflushed = False
 
 
 def parse_dest(s: str) -> Dest:
@@ -118,162 +479,192 @@ def parse_dest(s: str) -> Dest:
     return Dest(host=s.strip(), port=ESP32_PORT)
 
 
-def run(live_only: bool, dests: List[Dest]):
+def run(live_only: bool, dests: List[Dest], quiet: bool = False):
     ir = irsdk.IRSDK()
     ir.startup()
-
-    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    get = ir.__getitem__  # bound once; avoids the ir[...] dispatch on every read
 
     seq = 0
     last_print = 0.0
     period = 1.0 / SEND_HZ
+    next_t = time.monotonic()
+    # No console under pythonw.exe (sys.stdout is None): behave like -q
+    quiet = quiet or sys.stdout is None
+    if not quiet:
+        write = sys.stdout.write
+        flush = sys.stdout.flush
+    wall_anchor, mono_anchor = time.time(), time.monotonic()
+
+    # Values that only change between sessions (see SESSION_REFRESH_TICKS)
+    session_key = None
+    session_seq = 0
+    player_idx = 0
+    steer_max = 0.0
+    session_total = 0.0
+
+    # Formatted payload fields after seq, reused while the values are unchanged
+    last_values = None
+    payload_tail = b""
 
-    writer = None
     f = None
+    multi = MultiSender.create(dests)
+    worker = None
 
     try:
         if not live_only:
-            f = open(LOG_PATH, "w", newline="", encoding="utf-8")
-            writer = csv.DictWriter(
-                f,
-                fieldnames=[
-                    "ts_unix", "seq",
-                    "rpm", "gear", "throttle", "brake", "steer_norm",
-                    "session_remain_s",
-                    "fuel_l", "fuel_pct", "speed_kmh",
-                    "incidents",
-                    "lap", "pos", "class_pos",
-                    "lap_cur", "lap_last", "lap_best",
-                    "is_replay",
-                ],
-            )
-            writer.writeheader()
+            f = open(LOG_PATH, "wb", buffering=64 * 1024)
+            f.write(CSV_HEADER)
             print(f"[+] Logging to: {LOG_PATH}")
         else:
             print("[+] Live mode: CSV logging disabled (-l)")
 
+        worker = SendWorker(dests, multi, f)
+
         dest_str = ", ".join([f"{d.host}:{d.port}" for d in dests])
         print(f"[+] Sending UDP to: {dest_str} @ {SEND_HZ:.1f} Hz")
         print("[i] Start iRacing and get in-car to see live values.")
 
         while True:
             if not ir.is_initialized:
-                if time.time() - last_print > 1.0:
+                if time.monotonic() - last_print > 1.0:
                     print("[...] Waiting for iRacing SDK (not initialized)")
-                    last_print = time.time()
+                    last_print = time.monotonic()
                 time.sleep(0.5)
                 ir.startup()
+                next_t = time.monotonic()
+                session_key = None
                 continue
 
-            # Replay indicator + player index (for CarIdx fallbacks)
-            is_replay = int(ir_get(ir, "IsReplayPlaying", 0))
-            player_idx = int(ir_get(ir, "PlayerCarIdx", 0))
-
-            # Core telemetry
-            rpm = float(ir_get(ir, "RPM", 0.0))
-            gear = int(ir_get(ir, "Gear", 0))
-            throttle = float(ir_get(ir, "Throttle", 0.0))   # 0..1
-            brake = float(ir_get(ir, "Brake", 0.0))         # 0..1
-
-            # Steering normalization (kept for CSV/debug, NOT sent)
-            steer_angle = float(ir_get(ir, "SteeringWheelAngle", 0.0))
-            steer_max = float(ir_get(ir, "SteeringWheelAngleMax", 0.0))
-            steer_norm = (steer_angle / steer_max) if steer_max not in (0.0, None) else 0.0
-
-            # Session remaining + incidents (NEW, sent)
-            session_remain_s = float(get_session_time_remain(ir))
-            incidents = int(get_incidents(ir))
-
-            # Fuel + speed
-            fuel_l = float(ir_get(ir, "FuelLevel", 0.0))
-            fuel_pct = norm_pct(ir_get(ir, "FuelLevelPct", 0.0))  # kept for CSV/debug
-
-            speed_ms = float(ir_get(ir, "Speed", 0.0))  # m/s
-            speed_kmh = speed_ms * 3.6
-
-            # Lap + position (prefer PlayerCar..., fallback to CarIdx... especially in replay)
-            lap = int(ir_get(ir, "Lap", 0))
-            pos = int(ir_get(ir, "PlayerCarPosition", 0))
-            class_pos = int(ir_get(ir, "PlayerCarClassPosition", 0))
-
-            if player_idx >= 0:
-                if lap == 0:
-                    lap = int(ir_get_idx(ir, "CarIdxLap", player_idx, lap))
-                if pos == 0:
-                    pos = int(ir_get_idx(ir, "CarIdxPosition", player_idx, pos))
-                if class_pos == 0:
-                    class_pos = int(ir_get_idx(ir, "CarIdxClassPosition", player_idx, class_pos))
-
-            # Lap times (seconds)
-            lap_cur = float(ir_get(ir, "LapCurrentLapTime", 0.0))
-            lap_last = float(ir_get(ir, "LapLastLapTime", 0.0))
-            lap_best = float(ir_get(ir, "LapBestLapTime", 0.0))
-
-            # If replay has zeros, try per-car arrays
-            if player_idx >= 0:
-                if lap_last <= 0.0:
-                    lap_last = float(ir_get_idx(ir, "CarIdxLastLapTime", player_idx, lap_last))
-                if lap_best <= 0.0:
-                    lap_best = float(ir_get_idx(ir, "CarIdxBestLapTime", player_idx, lap_best))
-
-            # UDP payload (15 values) — MUST match ESP32 parse order:
-            # seq,rpm,gear,thr,brk,session_remain_s,fuel_l,incidents,speed_kmh,lap,pos,class_pos,lap_cur,lap_last,lap_best
-            payload = (
-                f"{seq},{rpm:.1f},{gear},"
-                f"{throttle:.3f},{brake:.3f},{session_remain_s:.2f},"
-                f"{fuel_l:.3f},{incidents},"
-                f"{speed_kmh:.2f},"
-                f"{lap},{pos},{class_pos},"
-                f"{lap_cur:.3f},{lap_last:.3f},{lap_best:.3f}"
-            ).encode("ascii", errors="ignore")
+            # Read everything from one consistent snapshot of the telemetry buffer
+            ir.freeze_var_buffer_latest()
+            try:
+                (
+                    is_replay, session_id,
+                    rpm, gear, throttle, brake,
+                    steer_angle,
+                    fuel_l, fuel_pct_raw, speed_ms,
+                    lap, pos, class_pos,
+                    lap_cur, lap_last, lap_best,
+                ) = ir_get_tick(ir)
+
+                # Replay indicator; per-session values (player index for CarIdx
+                # fallbacks, steering lock, session length) are cached and only
+                # re-read periodically or when the session/replay state changes
+                is_replay = int(is_replay or 0)
+                key = (session_id, is_replay)
+                if key != session_key or seq - session_seq >= SESSION_REFRESH_TICKS:
+                    player_idx = int(ir_get(get, "PlayerCarIdx", 0))
+                    steer_max = float(ir_get(get, "SteeringWheelAngleMax", 0.0))
+                    session_total = float(ir_get(get, "SessionTimeTotal", 0.0))
+                    session_key = key
+                    session_seq = seq
+
+                # Core telemetry
+                rpm = float(rpm or 0.0)
+                gear = int(gear or 0)
+                throttle = float(throttle or 0.0)   # 0..1
+                brake = float(brake or 0.0)         # 0..1
+
+                # Steering normalization (kept for CSV/debug, NOT sent)
+                steer_angle = float(steer_angle or 0.0)
+                steer_norm = (steer_angle / steer_max) if steer_max not in (0.0, None) else 0.0
+
+                # Session remaining + incidents (NEW, sent)
+                session_remain_s = float(get_session_time_remain(get, session_total))
+                incidents = int(get_incidents(get))
+
+                # Fuel + speed
+                fuel_l = float(fuel_l or 0.0)
+                fuel_pct = norm_pct(fuel_pct_raw)  # kept for CSV/debug
+
+                speed_ms = float(speed_ms or 0.0)  # m/s
+                speed_kmh = speed_ms * 3.6
+
+                # Lap + position (prefer PlayerCar..., fallback to CarIdx... especially in replay)
+                lap = int(lap or 0)
+                pos = int(pos or 0)
+                class_pos = int(class_pos or 0)
+
+                if player_idx >= 0:
+                    if lap == 0:
+                        lap = int(ir_get_idx(get, "CarIdxLap", player_idx, lap))
+                    if pos == 0:
+                        pos = int(ir_get_idx(get, "CarIdxPosition", player_idx, pos))
+                    if class_pos == 0:
+                        class_pos = int(ir_get_idx(get, "CarIdxClassPosition", player_idx, class_pos))
+
+                # Lap times (seconds)
+                lap_cur = float(lap_cur or 0.0)
+                lap_last = float(lap_last or 0.0)
+                lap_best = float(lap_best or 0.0)
+
+                # If replay has zeros, try per-car arrays
+                if player_idx >= 0:
+                    if lap_last <= 0.0:
+                        lap_last = float(ir_get_idx(get, "CarIdxLastLapTime", player_idx, lap_last))
+                    if lap_best <= 0.0:
+                        lap_best = float(ir_get_idx(get, "CarIdxBestLapTime", player_idx, lap_best))
+            finally:
+                ir.unfreeze_var_buffer_latest()
+
+            values = (
+                rpm, gear,
+                throttle, brake, session_remain_s,
+                fuel_l, incidents,
+                speed_kmh,
+                lap, pos, class_pos,
+                lap_cur, lap_last, lap_best,
+            )
+            if values != last_values:
+                payload_tail = PAYLOAD_TAIL_FMT % values
+                last_values = values
+            payload = PAYLOAD_SEQ_FMT % seq + payload_tail
+
+            now = time.monotonic()
+
+            # Hand the send + CSV row to the worker thread
+            row = None
+            if f is not None:
+                # Wall-clock timestamp from a monotonic offset; re-anchor periodically
+                if now - mono_anchor >= CLOCK_ANCHOR_S:
+                    wall_anchor, mono_anchor = time.time(), now
+                row = (
+                    wall_anchor + (now - mono_anchor), seq,
+                    rpm, gear, throttle, brake, steer_norm,
+                    session_remain_s,
+                    fuel_l, fuel_pct, speed_kmh,
+                    incidents,
+                    lap, pos, class_pos,
+                    lap_cur, lap_last, lap_best,
+                    is_replay,
+                )
+            worker.put(payload, row)
 
-            # Send to all destinations (ESP32, Pi, etc.)
-            for d in dests:
-                resolved = d.resolve(interval_s=5.0)
-                if resolved is None:
-                    continue
-                sock.sendto(payload, resolved)
-
-            # Optional CSV logging
-            if writer is not None:
-                writer.writerow({
-                    "ts_unix": time.time(),
-                    "seq": seq,
-                    "rpm": rpm,
-                    "gear": gear,
-                    "throttle": throttle,
-                    "brake": brake,
-                    "steer_norm": steer_norm,
-                    "session_remain_s": session_remain_s,
-                    "fuel_l": fuel_l,
-                    "fuel_pct": fuel_pct,
-                    "speed_kmh": speed_kmh,
-                    "incidents": incidents,
-                    "lap": lap,
-                    "pos": pos,
-                    "class_pos": class_pos,
-                    "lap_cur": lap_cur,
-                    "lap_last": lap_last,
-                    "lap_best": lap_best,
-                    "is_replay": is_replay,
-                })
-
-            # Console status at 1 Hz
-            now = time.time()
-            if now - last_print >= 1.0:
-                print(
+            # Console status at 1 Hz (skipped entirely with -q)
+            if not quiet and now - last_print >= 1.0:
+                write(
                     f"seq={seq:7d} rpm={rpm:7.0f} gear={gear:2d} "
                     f"spd={speed_kmh:6.1f}kmh fuel={fuel_l:6.2f}L ({fuel_pct*100:5.1f}%) "
                     f"inc={incidents:2d} "
                     f"remain={session_remain_s:7.1f}s "
                     f"lap={lap:3d} pos={pos:3d} cls={class_pos:3d} "
                     f"cur={lap_cur:7.3f} last={lap_last:7.3f} best={lap_best:7.3f} "
-                    f"thr={throttle:4.2f} brk={brake:4.2f} replay={is_replay}"
+                    f"thr={throttle:4.2f} brk={brake:4.2f} replay={is_replay} "
+                    f"tx_err={worker.send_errors}\n"
                 )
+                flush()
                 last_print = now
 
             seq += 1
-            time.sleep(period)
+
+            # Sleep until the next absolute deadline so work time doesn't add drift.
+            # If we fell behind, restart the schedule instead of bursting to catch up.
+            next_t += period
+            dt = next_t - time.monotonic()
+            if dt > 0:
+                time.sleep(dt)
+            else:
+                next_t = time.monotonic()
 
     except KeyboardInterrupt:
         print("\n[!] Stopped by user.")
@@ -282,12 +673,23 @@ def run(live_only: bool, dests: List[Dest]):
             ir.shutdown()
         except Exception:
             pass
-        try:
-            sock.close()
-        except Exception:
-            pass
-        if f is not None:
-            f.close()
+        if worker is not None and not worker.stop():
+            # Still inside a send/write: leave the sockets and log open for it
+            print("[!] Send worker did not finish in time; final CSV rows may be lost.")
+        else:
+            if multi is not None:
+                multi.close()
+            for d in dests:
+                try:
+                    d.close()
+                except Exception:
+                    pass
+            if f is not None:
+                try:
+                    f.flush()
+                    os.fsync(f.fileno())
+                finally:
+                    f.close()
 
 
 def main():
@@ -303,6 +705,11 @@ def main():
         default=[],
         help='UDP destination "host" or "host:port". Can be used multiple times.'
     )
+    parser.add_argument(
+        "-q", "--quiet",
+        action="store_true",
+        help="Do not print the 1 Hz telemetry status line"
+    )
     args = parser.parse_args()
 
     if args.dest:
@@ -310,7 +717,7 @@ def main():
     else:
         dests = [Dest(host=ESP32_IP, port=ESP32_PORT)]
 
-    run(live_only=args.live, dests=dests)
+    run(live_only=args.live, dests=dests, quiet=args.quiet)
 
 
 if __name__ == "__main__":